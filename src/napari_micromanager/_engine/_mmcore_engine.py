@@ -16,7 +16,6 @@ from pymmcore_plus._logger import logger
 from pymmcore_plus.core._sequencing import SequencedEvent
 from pymmcore_plus.mda import MDAEngine
 from pymmcore_plus.mda._engine import ImagePayload
-from rich import print
 from useq import AcquireImage, HardwareAutofocus, MDAEvent, MDASequence
 
 if TYPE_CHECKING:
@@ -79,7 +78,7 @@ class ArduinoEngine(MDAEngine):
         """Execute an individual event and return the image data."""
         action = getattr(event, "action", None)
         if isinstance(action, HardwareAutofocus):
-            print(f"***Autofocus Event: {event.index}, action: {action}***")
+            logger.info("Autofocus Event: %s, action: %s", event.index, action)
             # skip if no autofocus device is found
             if not self._mmc.getAutoFocusDevice():
                 logger.warning("No autofocus device found. Cannot execute autofocus.")
@@ -132,11 +131,13 @@ class ArduinoEngine(MDAEngine):
         led_power = self._exec_stimulation[t_index][0]
         led_pulse_duration = self._exec_stimulation[t_index][1] / 1000  # convert to sec
 
-        print(
-            f"\n***Stimulation Event: {event.index}, "
-            f"LED: {self._arduino_led_pin}, "
-            f"LED Pulse Duration: {led_pulse_duration * 1000} ms, "
-            f"LED Power: {led_power} %***\n"
+        logger.info(
+            "Stimulation Event: %s, LED: %s, LED Pulse Duration: %s ms, "
+            "LED Power: %s %%",
+            event.index,
+            self._arduino_led_pin,
+            led_pulse_duration * 1000,
+            led_power,
         )
 
         # switch on the LED
@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import contextlib
 import json
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Tuple, cast
 
@@ -63,6 +64,14 @@ TOOL_SIZE = 35
 USER_DATA_DIR = Path(user_data_dir(appname="napari_micromanager"))
 USER_LAYOUT_PATH = USER_DATA_DIR / "napari_micromanager_layout.json"
 
+# all the QMainWindow dock widget areas
+DOCK_AREAS: tuple[Qt.DockWidgetArea, ...] = (
+    Qt.DockWidgetArea.RightDockWidgetArea,
+    Qt.DockWidgetArea.LeftDockWidgetArea,
+    Qt.DockWidgetArea.TopDockWidgetArea,
+    Qt.DockWidgetArea.BottomDockWidgetArea,
+)
+
 
 class GroupsAndPresets(GroupPresetTableWidget):
     """Subclass of GroupPresetTableWidget.
@@ -121,20 +130,19 @@ class MicroManagerToolbar(QMainWindow):
         # min max widget
         self.minmax = MinMax(parent=self)
 
-        if (win := getattr(self.viewer.window, "_qt_window", None)) is not None:
+        # napari main window (None if the viewer has no Qt window)
+        self._qt_window: QMainWindow | None = getattr(
+            self.viewer.window, "_qt_window", None
+        )
+
+        if (win := self._qt_window) is not None:
             # make the tabs of tabbed dockwidgets apprearing on top (North)
-            areas = [
-                Qt.DockWidgetArea.RightDockWidgetArea,
-                Qt.DockWidgetArea.LeftDockWidgetArea,
-                Qt.DockWidgetArea.TopDockWidgetArea,
-                Qt.DockWidgetArea.BottomDockWidgetArea,
-            ]
-            for area in areas:
-                cast(QMainWindow, win).setTabPosition(
-                    area, QTabWidget.TabPosition.North
-                )
+            for area in DOCK_AREAS:
+                win.setTabPosition(area, QTabWidget.TabPosition.North)
 
         self._dock_widgets: dict[str, QDockWidget] = {}
+        # True while _load_layout is restoring the layout (the layout is not saved)
+        self._loading_layout = False
         # add toolbar items
         toolbar_items = [
             ObjectivesToolBar(self),
@@ -155,11 +163,8 @@ class MicroManagerToolbar(QMainWindow):
         self.installEventFilter(self)
 
     def _initialize(self) -> None:
-        if self._is_initialized or not (
-            win := getattr(self.viewer.window, "_qt_window", None)
-        ):
+        if self._is_initialized or not (win := self._qt_window):
             return
-        win = cast(QMainWindow, win)
         if (
             isinstance(dw := self.parent(), QDockWidget)
             and win.dockWidgetArea(dw) is not Qt.DockWidgetArea.TopDockWidgetArea
@@ -249,12 +254,14 @@ class MicroManagerToolbar(QMainWindow):
         )
         # fix napari bug that makes dock widgets too large
         with contextlib.suppress(AttributeError):
-            self.viewer.window._qt_window.resizeDocks(
+            self._qt_window.resizeDocks(  # type: ignore [union-attr]
                 [dock_wdg], [widget.sizeHint().width() + 20], Qt.Orientation.Horizontal
             )
         with contextlib.suppress(AttributeError):
             dock_wdg._close_btn = False
-        dock_wdg.setFloating(floating)
+        # the dock widget is created docked, only undock it if requested
+        if floating:
+            dock_wdg.setFloating(True)
         return dock_wdg
 
     def _connect_dock_widget(self, dock_wdg: QDockWidget) -> None:
@@ -277,15 +284,12 @@ class MicroManagerToolbar(QMainWindow):
         restoring the layout, we must recreate these widgets. If not, they won't be
         included in the restored layout.
         """
-        if getattr(self.viewer.window, "_qt_window", None) is None:
+        # don't save the layout for each of the changes triggered while loading it
+        if (main_win := self._qt_window) is None or self._loading_layout:
             return
-        # get the names of the pymmcore_widgets that are part of the layout
-        pymmcore_wdgs: list[str] = []
-        main_win = self.viewer.window._qt_window
-        for dock_wdg in main_win.findChildren(QDockWidget):
-            wdg_name = dock_wdg.objectName()
-            if wdg_name in DOCK_WIDGETS:
-                pymmcore_wdgs.append(wdg_name)
+        # get the names of the pymmcore_widgets that are part of the layout. We use the
+        # self._dock_widgets index instead of walking the main window children.
+        pymmcore_wdgs: list[str] = list(self._dock_widgets)
 
         # get the state of the napari main window as bytes
         state_bytes = main_win.saveState().data()
@@ -301,41 +305,52 @@ class MicroManagerToolbar(QMainWindow):
         if not USER_LAYOUT_PATH.exists():
             USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+        # write the whole file at once to a temporary file and then replace the layout
+        # file so that an interrupted save never leaves a truncated layout behind
+        tmp = USER_LAYOUT_PATH.with_suffix(".json.tmp")
         try:
-            with open(USER_LAYOUT_PATH, "w") as json_file:
-                json.dump(data, json_file)
+            tmp.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp, USER_LAYOUT_PATH)
         except Exception as e:
             print(f"Was not able to save layout to file. Error: {e}")
 
     def _load_layout(self) -> None:
         """Load the napari-micromanager layout from a json file."""
-        if not USER_LAYOUT_PATH.exists():
+        if (main_win := self._qt_window) is None or not USER_LAYOUT_PATH.exists():
             return
 
+        # disable updates while the dock widgets are created and the state is restored
+        # so that the main window is laid out and repainted only once at the end
+        main_win.setUpdatesEnabled(False)
+        self._loading_layout = True
         try:
-            with open(USER_LAYOUT_PATH) as f:
-                data = json.load(f)
+            # read the whole file at once and parse it (no incremental text reads)
+            data = json.loads(USER_LAYOUT_PATH.read_bytes())
 
-                # get the layout state bytes
-                state_bytes = data.get("layout_state")
+            # get the layout state bytes
+            state_bytes = data.get("layout_state")
 
-                if state_bytes is None:
-                    return
+            if state_bytes is None:
+                return
 
-                # add pymmcore_widgets to the main window
-                pymmcore_wdgs = data.get("pymmcore_widgets", [])
-                for wdg_name in pymmcore_wdgs:
-                    if wdg_name in DOCK_WIDGETS:
-                        self._show_dock_widget(wdg_name)
+            # add pymmcore_widgets to the main window
+            pymmcore_wdgs = data.get("pymmcore_widgets", [])
+            for wdg_name in pymmcore_wdgs:
+                if wdg_name in DOCK_WIDGETS:
+                    self._show_dock_widget(wdg_name)
 
-                # Convert base64 encoded string back to bytes
-                state_bytes = base64.b64decode(state_bytes)
+            # Convert base64 encoded string back to bytes
+            state_bytes = base64.b64decode(state_bytes)
 
-                # restore the layout state
-                self.viewer.window._qt_window.restoreState(QByteArray(state_bytes))
+            # restore the layout state
+            main_win.restoreState(QByteArray(state_bytes))
 
         except Exception as e:
             print(f"Was not able to load layout from file. Error: {e}")
+        finally:
+            self._loading_layout = False
+            main_win.setUpdatesEnabled(True)
+            main_win.updateGeometry()
 
 
 class ScrollableWidget(QWidget):
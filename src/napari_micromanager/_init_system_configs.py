@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 from pathlib import Path
 from typing import cast
 from warnings import warn
@@ -65,18 +67,16 @@ class InitializeSystemConfigurations(QObject):
         create if does not yet exists) the list of Micro-Manager configurations paths
         saved in the USER_CONFIGS_PATHS as a json file.
         """
-        # create USER_CONFIGS_PATHS if it doesn't exist
+        # create the USER_DIR if it doesn't exist (USER_CONFIGS_PATHS is created below)
         if not USER_CONFIGS_PATHS.exists():
             USER_DIR.mkdir(parents=True, exist_ok=True)
-            with open(USER_CONFIGS_PATHS, "w") as f:
-                json.dump({"paths": []}, f)
 
-        # get the paths from the json file
+        # get the paths from the json file (if any) and from the MicroManager folders
         configs_paths = self._get_config_paths()
 
-        # write the data back to the file
+        # write the data to the file
         with open(USER_CONFIGS_PATHS, "w") as f:
-            json.dump({"paths": configs_paths}, f)
+            json.dump({"paths": configs_paths}, f, separators=(",", ":"))
 
     def _get_config_paths(self) -> list[str]:
         """Return the paths from the json file.
@@ -87,25 +87,25 @@ class InitializeSystemConfigurations(QObject):
         if they are not already there.
         """
         try:
-            with open(USER_CONFIGS_PATHS) as f:
-                data = json.load(f)
-
-            # get path list from json file
-            paths = cast(list, data.get("paths", []))
+            data = (
+                json.loads(USER_CONFIGS_PATHS.read_bytes())
+                if USER_CONFIGS_PATHS.exists()
+                else {}
+            )
 
-            # remove any path that doesn't exist
-            for path in paths:
-                if not Path(path).exists():
-                    paths.remove(path)
+            # get path list from json file removing any path that doesn't exist
+            paths = [p for p in cast(list, data.get("paths", [])) if Path(p).exists()]
 
             # get all the .cfg files in the MicroManager folder
             cfg_files = self._get_micromanager_cfg_files()
 
-            # add all the .cfg files to the list if they are not already there
-            for cfg in reversed(cfg_files):
-                if str(cfg) not in paths:
-                    # using insert so we leave the empty string at the end
-                    paths.insert(0, str(cfg))
+            # add all the .cfg files at the start of the list if they are not already
+            # there (so we leave the empty string at the end and the last selected
+            # config first) and remove any duplicate keeping the first occurrence
+            known = set(paths)
+            paths = list(
+                dict.fromkeys([*(c for c in cfg_files if c not in known), *paths])
+            )
 
         except json.JSONDecodeError:
             paths = []
@@ -113,14 +113,42 @@ class InitializeSystemConfigurations(QObject):
 
         return paths
 
-    def _get_micromanager_cfg_files(self) -> list[Path]:
-        """Return all the .cfg files from all the MicroManager folders."""
+    def _get_micromanager_cfg_files(self) -> list[str]:
+        """Return the paths of all the .cfg files from all the MicroManager folders."""
         mm: list = find_micromanager(False)
-        cfg_files: list[Path] = []
-        for mm_dir in mm:
-            cfg_files.extend(Path(mm_dir).glob("*.cfg"))
+        # the folders modification time is part of the cache key so that adding or
+        # removing a .cfg file in a MicroManager folder invalidates the cache
+        return list(_find_cfg_files(tuple((d, _dir_mtime(d)) for d in mm)))
+
 
-        return cfg_files
+def _dir_mtime(path: str) -> float:
+    """Return the modification time of a folder (or -1 if it cannot be accessed)."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return -1.0
+
+
+@functools.lru_cache(maxsize=1)
+def _find_cfg_files(mm_dirs: tuple[tuple[str, float], ...]) -> tuple[str, ...]:
+    """Return the paths of all the .cfg files in the given MicroManager folders.
+
+    `mm_dirs` is a tuple of (folder, modification time). The result is cached so that
+    the folders are not globbed again unless one of them changed.
+    """
+    cfg_files: list[str] = []
+    for mm_dir, _ in mm_dirs:
+        # os.scandir avoids creating a Path and fnmatch-ing every entry in the folder
+        try:
+            with os.scandir(mm_dir) as it:
+                cfg_files.extend(
+                    str(Path(mm_dir, entry.name))
+                    for entry in it
+                    if os.path.normcase(entry.name).endswith(".cfg") and entry.is_file()
+                )
+        except OSError:
+            continue
+    return tuple(cfg_files)
 
 
 class StartupConfigurationsDialog(QDialog):
@@ -160,8 +160,6 @@ class _NapariMDAHandler:
 
         return layer_name, im_idx
 
-        return layer_name, None
-
     @ensure_main_thread  # type: ignore [misc]
     def _update_viewer_dims(
         self, args: tuple[str | None, tuple[int, ...] | None]
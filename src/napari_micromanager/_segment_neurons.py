@@ -1,15 +1,21 @@
+from __future__ import annotations
+
 import multiprocessing as mp
 import time
 
 # from collections import deque
 from multiprocessing import Process
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
 import numpy as np
-import useq
-from cellpose import io, models, plot
-from pymmcore_plus import CMMCorePlus
+
+if TYPE_CHECKING:
+    import useq
+
+    # cellpose (and torch) are heavy to import, they are imported only when needed
+    from cellpose import models
+    from pymmcore_plus import CMMCorePlus
 
 
 class SegmentNeurons:
@@ -67,6 +73,8 @@ class SegmentNeurons:
 
     def _load_model(self):
         """Load CP model once the sequence started."""
+        from cellpose import models
+
         print("                Cellpose model is loaded.")
         dir_path = Path(__file__).parent
         model_path = Path.joinpath(dir_path, "CP_calcium")
@@ -75,7 +83,6 @@ class SegmentNeurons:
 
     def _on_frame_ready(self, image: np.ndarray, event: useq.MDAEvent) -> None:
         # start the segmentation process
-        print("FRAME READY", event.index)
         t_index = event.index.get("t")
         p_index = event.index.get("p")
         if t_index is not None and t_index == 0:
@@ -185,6 +192,8 @@ def _segmentation_worker(queue: mp.Queue, cp_model: models.CellposeModel,
 def _segment_image(image: np.ndarray, cp_model: models.CellposeModel,
                    folder_path: Path, exp_name: str, pos: int) -> None:
         """Segment the image."""
+        from cellpose import io, plot
+
         channels = [0, 0]
         print("     SEGMENTING IMAGE", image.shape)
         masks, flows, _ = cp_model.eval(image,
@@ -208,6 +217,8 @@ def _segment_image(image: np.ndarray, cp_model: models.CellposeModel,
 def _save_overlay(img: np.ndarray, channels: list,
                     masks: np.ndarray, save_path: Path) -> None:
     """Save the overlay image of masks over original image."""
+    from cellpose import io, plot
+
     img0 = img.copy()
 
     if img0.shape[0] < 4:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 from warnings import warn
@@ -81,8 +82,6 @@ def ensure_unique(path: Path, extension: str = ".tif", ndigits: int = 3) -> Path
 
 def add_path_to_config_json(path: Path | str) -> None:
     """Update the stystem configurations json file with the new path."""
-    import json
-
     if not USER_CONFIGS_PATHS.exists():
         return
 
@@ -96,15 +95,13 @@ def add_path_to_config_json(path: Path | str) -> None:
     except json.JSONDecodeError:
         data = {"paths": []}
 
-    # Append the new path. using insert so we leave the empty string at the end
-    paths = cast(list, data.get("paths", []))
-    if path in paths:
-        paths.remove(path)
-    paths.insert(0, path)
+    # Add the new path at the start (so we leave the empty string at the end) and
+    # remove any duplicate in a single pass
+    paths = list(dict.fromkeys([path, *cast(list, data.get("paths", []))]))
 
     # Write the data back to the file
     with open(USER_CONFIGS_PATHS, "w") as f:
-        json.dump({"paths": paths}, f)
+        json.dump({"paths": paths}, f, separators=(",", ":"))
 
 
 def save_sys_config_dialog(
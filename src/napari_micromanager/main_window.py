@@ -3,6 +3,7 @@ from __future__ import annotations
 import atexit
 import contextlib
 import logging
+import weakref
 from typing import TYPE_CHECKING, Any, Callable, cast
 
 import napari
@@ -10,6 +11,7 @@ import napari.layers
 import napari.viewer
 from pymmcore_plus import CMMCorePlus
 from pymmcore_widgets.hcwizard.intro_page import SRC_CONFIG
+from qtpy.QtCore import QTimer
 from qtpy.QtWidgets import QAction, QMenuBar
 
 from napari_micromanager._engine._mmcore_engine import ArduinoEngine
@@ -32,6 +34,10 @@ if TYPE_CHECKING:
 logging.getLogger("napari.loader").setLevel(logging.WARNING)
 logging.getLogger("in_n_out").setLevel(logging.WARNING)
 
+# interval (ms) used to throttle the events that trigger a minmax widget update: the
+# update runs at most once per interval (~one frame at 60 Hz) during a burst of events
+MINMAX_UPDATE_INTERVAL = 16
+
 
 class MainWindow(MicroManagerToolbar):
     """The main napari-micromanager widget that gets added to napari."""
@@ -54,26 +60,39 @@ class MainWindow(MicroManagerToolbar):
         # this object mediates the connection between the viewer and core events
         self._core_link = CoreViewerLink(viewer, self._mmc, self)
 
+        # timer used to throttle bursts of events (e.g. dims slider drags): the first
+        # event starts it and the events received while it is pending are merged into
+        # the single minmax update that runs when it fires.
+        self._minmax_timer = QTimer(self)
+        self._minmax_timer.setSingleShot(True)
+        self._minmax_timer.setInterval(MINMAX_UPDATE_INTERVAL)
+        self._minmax_timer.timeout.connect(self._do_update_max_min)
+
         # some remaining connections related to widgets ... TODO: unify with superclass
         self._connections: list[tuple[PSignalInstance, Callable]] = [
             (self.viewer.layers.events, self._update_max_min),
             (self.viewer.layers.selection.events, self._update_max_min),
             (self.viewer.dims.events.current_step, self._update_max_min),
         ]
-        for signal, slot in self._connections:
-            signal.connect(slot)
 
         # add minmax dockwidget
         if "MinMax" not in getattr(self.viewer.window, "_dock_widgets", []):
             self.viewer.window.add_dock_widget(self.minmax, name="MinMax", area="left")
 
-        # queue cleanup
+        # queue cleanup. atexit only holds a weak reference to this widget so that it
+        # can be garbage collected when it is closed.
         self.destroyed.connect(self._cleanup)
-        atexit.register(self._cleanup)
+        self._atexit_cleanup = _weak_atexit_callback(self._cleanup)
+        atexit.register(self._atexit_cleanup)
 
         # load layout
         self._load_layout()
 
+        # connect only once the dock widgets are in place so that adding them does not
+        # schedule minmax updates on a half-built window
+        for signal, slot in self._connections:
+            signal.connect(slot)
+
         # Micro-Manager Hardware Configuration Wizard
         self._wiz: HardwareConfigWizard | None = None
 
@@ -86,7 +105,7 @@ class MainWindow(MicroManagerToolbar):
             # provided to either select one from the list of available ones or to create
             # a new one.
             self._init_cfg = InitializeSystemConfigurations(
-                parent=self.viewer.window._qt_window, config=config, mmcore=self._mmc
+                parent=self._qt_window, config=config, mmcore=self._mmc
             )
             return
 
@@ -99,16 +118,24 @@ class MainWindow(MicroManagerToolbar):
                 signal.disconnect(slot)
         # Clean up temporary files we opened.
         self._core_link.cleanup()
-        atexit.unregister(self._cleanup)  # doesn't raise if not connected
+        atexit.unregister(self._atexit_cleanup)  # doesn't raise if not connected
 
     def _update_max_min(self, *_: Any) -> None:
-        visible = (x for x in self.viewer.layers.selection if x.visible)
-        self.minmax.update_from_layers(
-            lr for lr in visible if isinstance(lr, napari.layers.Image)
-        )
+        # throttle bursts of layers/selection/dims events. The timer is not restarted
+        # if already pending so that the update still runs during a long burst.
+        if not self._minmax_timer.isActive():
+            self._minmax_timer.start()
+
+    def _do_update_max_min(self) -> None:
+        layers = [
+            lr
+            for lr in self.viewer.layers.selection
+            if lr.visible and isinstance(lr, napari.layers.Image)
+        ]
+        self.minmax.update_from_layers(layers)
 
     def _add_menu(self) -> None:
-        if (win := getattr(self.viewer.window, "_qt_window", None)) is None:
+        if (win := self._qt_window) is None:
             return
 
         menubar = cast(QMenuBar, win.menuBar())
@@ -133,16 +160,16 @@ class MainWindow(MicroManagerToolbar):
 
     def _save_cfg(self) -> None:
         """Save the current Micro-Manager system configuration."""
-        save_sys_config_dialog(parent=self.viewer.window._qt_window, mmcore=self._mmc)
+        save_sys_config_dialog(parent=self._qt_window, mmcore=self._mmc)
 
     def _load_cfg(self) -> None:
         """Load a Micro-Manager system configuration."""
-        load_sys_config_dialog(parent=self.viewer.window._qt_window, mmcore=self._mmc)
+        load_sys_config_dialog(parent=self._qt_window, mmcore=self._mmc)
 
     def _show_config_wizard(self) -> None:
         """Show the Micro-Manager Hardware Configuration Wizard."""
         if self._wiz is None:
-            self._wiz = HardwareConfigWizard(parent=self.viewer.window._qt_window)
+            self._wiz = HardwareConfigWizard(parent=self._qt_window)
 
         if self._wiz.isVisible():
             self._wiz.raise_()
@@ -150,3 +177,14 @@ class MainWindow(MicroManagerToolbar):
             current_cfg = self._mmc.systemConfigurationFile() or ""
             self._wiz.setField(SRC_CONFIG, current_cfg)
             self._wiz.show()
+
+
+def _weak_atexit_callback(method: Callable[[], Any]) -> Callable[[], None]:
+    """Return a callback that calls `method` only if its instance is still alive."""
+    ref = weakref.WeakMethod(method)
+
+    def _callback() -> None:
+        if (fn := ref()) is not None:
+            fn()
+
+    return _callback
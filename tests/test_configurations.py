@@ -63,4 +63,28 @@ def test_config_init(qtbot: QtBot, core: CMMCorePlus, config: Path | None, wiz:
     USER_CONFIGS_PATHS.unlink()
 
 
+def test_config_paths_pruned_and_deduplicated(
+    qtbot: QtBot, core: CMMCorePlus, tmp_path: Path
+):
+    assert not USER_CONFIGS_PATHS.exists()
+
+    config = str(configs[1])
+    init = InitializeSystemConfigurations(mmcore=core, config=config)
+    cfg_files = init._get_micromanager_cfg_files()
+
+    # without a json file, only the Micro-Manager .cfg files are listed
+    USER_CONFIGS_PATHS.unlink()
+    assert init._get_config_paths() == cfg_files
+
+    # paths that don't exist anymore are removed and duplicates are dropped, the
+    # stored order is kept so that the last selected config stays first
+    missing = str(tmp_path / "missing.cfg")
+    USER_CONFIGS_PATHS.write_text(
+        json.dumps({"paths": [config, missing, config, *cfg_files]})
+    )
+    assert init._get_config_paths() == [config, *cfg_files]
+
+    USER_CONFIGS_PATHS.unlink()
+
+
 # TODO: test the config wizard and the menu actions
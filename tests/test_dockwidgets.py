@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING
 from napari_micromanager._gui_objects._toolbar import DOCK_WIDGETS, USER_LAYOUT_PATH
 
 if TYPE_CHECKING:
-
     from napari_micromanager.main_window import MainWindow
 
 
@@ -20,3 +19,28 @@ def test_dockwidgets(main_window: MainWindow):
     # a layout file should have been saved
     assert USER_LAYOUT_PATH.exists()
     USER_LAYOUT_PATH.unlink()
+
+
+def test_layout_not_saved_while_loading(main_window: MainWindow):
+    assert not USER_LAYOUT_PATH.exists()
+
+    main_window._show_dock_widget("MDA")
+    dock_wdg = main_window._dock_widgets["MDA"]
+
+    # save a layout with the MDA widget floating...
+    dock_wdg.setFloating(True)
+    main_window._save_layout()
+    saved = USER_LAYOUT_PATH.read_bytes()
+    # ...then dock it back (this saves the layout again) and restore the saved file
+    dock_wdg.setFloating(False)
+    USER_LAYOUT_PATH.write_bytes(saved)
+    before = USER_LAYOUT_PATH.stat()
+
+    # restoring the layout undocks the widget, which must not trigger a save
+    main_window._load_layout()
+    assert dock_wdg.isFloating()
+
+    after = USER_LAYOUT_PATH.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+    assert USER_LAYOUT_PATH.read_bytes() == saved
+    USER_LAYOUT_PATH.unlink()
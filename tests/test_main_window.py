@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
+import numpy as np
 import useq
-from napari_micromanager.main_window import MainWindow
+from napari_micromanager.main_window import MINMAX_UPDATE_INTERVAL, MainWindow
+from qtpy.QtCore import QTimer
 
 if TYPE_CHECKING:
     from pymmcore_plus import CMMCorePlus
@@ -45,3 +48,30 @@ def test_preview_while_mda(main_window: MainWindow, qtbot: QtBot):
 
     layers = [layer.name for layer in viewer.layers]
     assert "preview" not in layers
+
+
+def test_minmax_updates_during_dims_changes(main_window: MainWindow, qtbot: QtBot):
+    viewer = main_window.viewer
+    layer = viewer.add_image(np.arange(3 * 8 * 8, dtype=np.uint16).reshape(3, 8, 8))
+    viewer.layers.selection.active = layer
+    # let the update scheduled by adding/selecting the layer run first
+    qtbot.waitUntil(lambda: not main_window._minmax_timer.isActive())
+    label = main_window.minmax._label
+    label.clear()
+
+    # change the current step faster than the minmax update interval: the label
+    # should still be updated while the events keep coming
+    steps = itertools.cycle(range(3))
+    timer = QTimer()
+    timer.setInterval(MINMAX_UPDATE_INTERVAL // 4)
+    timer.timeout.connect(lambda: viewer.dims.set_current_step(0, next(steps)))
+    timer.start()
+    try:
+        qtbot.waitUntil(lambda: "<font" in label.text(), timeout=1000)
+    finally:
+        timer.stop()
+
+    # once the events stop, the label shows the range of the current slice
+    viewer.dims.set_current_step(0, 2)
+    expected = str(tuple(layer._calc_data_range(mode="slice")))
+    qtbot.waitUntil(lambda: expected in label.text(), timeout=1000)